@@ -22,6 +22,8 @@ use crate::{build_ims_bot_adapter, parse_ims_bot_adapter_connection};
 
 const BOT_ADAPTER_INSTANCE_IDLE_TIMEOUT_SECS: i64 = 15 * 60;
 const BOT_ADAPTER_HEARTBEAT_INTERVAL_SECS: u64 = 30;
+const BOT_ADAPTER_RECONNECT_BASE_DELAY_SECS: u64 = 2;
+const BOT_ADAPTER_RECONNECT_MAX_DELAY_SECS: u64 = 60;
 
 #[derive(Clone)]
 struct ActiveBotAdapterInstance {
@@ -55,23 +57,28 @@ impl ActiveAdapterManager {
         adapter: SharedBotAdapter,
     ) -> JoinHandle<()> {
         tokio::spawn(async move {
+            let mut retry_delay_secs = BOT_ADAPTER_RECONNECT_BASE_DELAY_SECS;
             loop {
                 let adapter_for_run = Arc::clone(&adapter);
                 match BotAdapter::start(adapter_for_run).await {
                     Ok(()) => {
+                        // A clean return means a session was established and then dropped,
+                        // so start the backoff over from the base delay
+                        retry_delay_secs = BOT_ADAPTER_RECONNECT_BASE_DELAY_SECS;
                         warn!(
-                            "[active_adapter_manager] bot adapter '{}' (config_id={}) disconnected, retrying in 2s",
-                            connection_name, connection_id
+                            "[active_adapter_manager] bot adapter '{}' (config_id={}) disconnected, retrying in {}s",
+                            connection_name, connection_id, retry_delay_secs
                         );
                     }
                     Err(err) => {
                         error!(
-                            "[active_adapter_manager] bot adapter '{}' (config_id={}) exited with error: {}. retrying in 2s",
-                            connection_name, connection_id, err
+                            "[active_adapter_manager] bot adapter '{}' (config_id={}) exited with error: {}. retrying in {}s",
+                            connection_name, connection_id, err, retry_delay_secs
                         );
                     }
                 }
-                tokio::time::sleep(Duration::from_secs(2)).await;
+                tokio::time::sleep(Duration::from_secs(retry_delay_secs)).await;
+                retry_delay_secs = (retry_delay_secs * 2).min(BOT_ADAPTER_RECONNECT_MAX_DELAY_SECS);
             }
         })
     }
@@ -1,15 +1,16 @@
 use async_recursion::async_recursion;
 use futures_util::{SinkExt, StreamExt};
 use log::{debug, error, info, warn};
+use serde::Deserialize;
 use std::collections::HashMap;
 use std::collections::VecDeque;
 use std::sync::atomic::AtomicBool;
 use std::sync::Arc;
-use tokio_tungstenite::{connect_async, tungstenite::Message as WsMessage};
+use tokio_tungstenite::{connect_async, tungstenite::Message as WsMessage, MaybeTlsStream};
 use uuid::Uuid;
 
 use super::event;
-use super::models::{MessageEvent, MessageType, Profile, RawMessageEvent};
+use super::models::{MessageEvent, Profile, RawMessageEvent};
 use crate::ws_action::ws_send_action_async;
 use storage_handler::{enrich_event_images, enrich_message_images, ImageCacheAdapter, PendingImageUpload};
 use tokio::sync::Mutex as TokioMutex;
@@ -73,6 +74,8 @@ pub type PendingActions = Arc<TokioMutex<HashMap<String, oneshot::Sender<serde_j
 pub struct BotAdapter {
     url: String,
     token: String,
+    /// Precomputed "Bearer <token>" value reused on every (re)connect.
+    auth_header: String,
     bot_profile: Option<Profile>,
     brain_agent: Option<AgentBox>,
     event_handlers: HashMap<String, event::EventHandler>,
@@ -138,6 +141,7 @@ impl BotAdapter {
     pub async fn new(config: BotAdapterConfig) -> Self {
         Self {
             url: config.url,
+            auth_header: format!("Bearer {}", config.token),
             token: config.token,
             bot_profile: Some(Profile {
                 qq_id: config.qq_id,
@@ -237,30 +241,29 @@ impl BotAdapter {
 
     /// Start the WebSocket connection and begin processing events using a shared handle
     pub async fn start(adapter: SharedBotAdapter) -> Result<()> {
-        let (url, token) = {
+        let (url, auth_header) = {
             let guard = adapter.lock().await;
-            (guard.url.clone(), guard.token.clone())
+            (guard.url.clone(), guard.auth_header.clone())
         };
 
         info!("Connecting to bot server at {}", url);
 
-        // Build the WebSocket request with authorization header
-        let request = http::Request::builder()
-            .uri(&url)
-            .header("Authorization", format!("Bearer {}", token))
-            .header("Host", extract_host(&url).unwrap_or("localhost"))
-            .header("Connection", "Upgrade")
-            .header("Upgrade", "websocket")
-            .header("Sec-WebSocket-Version", "13")
-            .header(
-                "Sec-WebSocket-Key",
-                tokio_tungstenite::tungstenite::handshake::client::generate_key(),
-            )
-            .body(())?;
+        let request = build_connect_request(&url, &auth_header)?;
 
         let (ws_stream, _) = connect_async(request).await?;
         info!("Connected to the qq bot server successfully.");
 
+        // Event and action frames are small and latency-sensitive; disable Nagle so
+        // they are sent immediately instead of waiting to coalesce with later writes
+        let nodelay_result = match ws_stream.get_ref() {
+            MaybeTlsStream::Plain(stream) => stream.set_nodelay(true),
+            MaybeTlsStream::NativeTls(stream) => stream.get_ref().get_ref().get_ref().set_nodelay(true),
+            _ => Ok(()),
+        };
+        if let Err(err) = nodelay_result {
+            warn!("Failed to set TCP_NODELAY on the bot server socket: {}", err);
+        }
+
         let (mut write, mut read) = ws_stream.split();
 
         let (action_tx, mut action_rx) = mpsc::unbounded_channel::<String>();
@@ -271,7 +274,17 @@ impl BotAdapter {
 
         tokio::spawn(async move {
             while let Some(msg) = action_rx.recv().await {
-                if write.send(WsMessage::Text(msg)).await.is_err() {
+                if write.feed(WsMessage::Text(msg)).await.is_err() {
+                    break;
+                }
+                // Drain any actions already queued so a burst goes out under a
+                // single flush instead of one flush per message
+                while let Ok(msg) = action_rx.try_recv() {
+                    if write.feed(WsMessage::Text(msg)).await.is_err() {
+                        return;
+                    }
+                }
+                if write.flush().await.is_err() {
                     break;
                 }
             }
@@ -282,18 +295,14 @@ impl BotAdapter {
                 Ok(WsMessage::Text(text)) => {
                     let adapter_clone = adapter.clone();
                     tokio::spawn(async move {
-                        BotAdapter::process_event(adapter_clone, text).await;
+                        BotAdapter::process_event(adapter_clone, text.into_bytes()).await;
                     });
                 }
                 Ok(WsMessage::Binary(data)) => {
-                    if let Ok(text) = String::from_utf8(data) {
-                        let adapter_clone = adapter.clone();
-                        tokio::spawn(async move {
-                            BotAdapter::process_event(adapter_clone, text).await;
-                        });
-                    } else {
-                        warn!("Received binary message that is not valid UTF-8");
-                    }
+                    let adapter_clone = adapter.clone();
+                    tokio::spawn(async move {
+                        BotAdapter::process_event(adapter_clone, data).await;
+                    });
                 }
                 Ok(WsMessage::Close(frame)) => {
                     if let Some(frame) = frame {
@@ -322,12 +331,13 @@ impl BotAdapter {
         Ok(())
     }
 
-    /// Process a single event message
-    async fn process_event(adapter: SharedBotAdapter, message: String) {
-        debug!("Received message: {}", message);
+    /// Process a single event message (raw frame payload, parsed directly from bytes)
+    async fn process_event(adapter: SharedBotAdapter, payload: Vec<u8>) {
+        debug!("Received message: {}", String::from_utf8_lossy(&payload));
 
-        // Parse the JSON message
-        let message_json: serde_json::Value = match serde_json::from_str(&message) {
+        // Parse the JSON message straight from the frame bytes, avoiding an
+        // intermediate UTF-8 validated String copy per frame
+        let message_json: serde_json::Value = match serde_json::from_slice(&payload) {
             Ok(v) => v,
             Err(e) => {
                 error!("Failed to parse message as JSON: {}", e);
@@ -355,6 +365,18 @@ impl BotAdapter {
             return;
         }
 
+        // Event parsing, image enrichment, and segment hydration can all issue
+        // follow-up bot-server actions; skip the whole pipeline when nothing on
+        // this adapter would consume the event anyway
+        let has_consumers = {
+            let guard = adapter.lock().await;
+            !guard.event_handlers.is_empty() || guard.brain_agent.is_some()
+        };
+        if !has_consumers {
+            debug!("Ignoring message event: no event handlers or brain agent registered");
+            return;
+        }
+
         // Parse as RawMessageEvent
         let raw_event: RawMessageEvent = match serde_json::from_value(message_json) {
             Ok(e) => e,
@@ -365,15 +387,7 @@ impl BotAdapter {
         };
 
         // Create the MessageEvent (messages are already deserialized in RawMessageEvent)
-        let mut event = MessageEvent {
-            message_id: raw_event.message_id,
-            message_type: raw_event.message_type,
-            sender: raw_event.sender.clone(),
-            message_list: raw_event.message.clone(),
-            group_id: raw_event.group_id,
-            group_name: raw_event.group_name.clone(),
-            is_group_message: matches!(raw_event.message_type, MessageType::Group),
-        };
+        let mut event = MessageEvent::from(raw_event);
 
         let image_cache_handle = BotAdapterImageCacheHandle(adapter.clone());
         enrich_event_images(&image_cache_handle, &mut event).await;
@@ -403,6 +417,23 @@ pub(crate) struct ResolvedMessageList {
     pub source_label: String,
 }
 
+/// Build the WebSocket upgrade request carrying the precomputed authorization header
+fn build_connect_request(url: &str, auth_header: &str) -> Result<http::Request<()>> {
+    let request = http::Request::builder()
+        .uri(url)
+        .header("Authorization", auth_header)
+        .header("Host", extract_host(url).unwrap_or("localhost"))
+        .header("Connection", "Upgrade")
+        .header("Upgrade", "websocket")
+        .header("Sec-WebSocket-Version", "13")
+        .header(
+            "Sec-WebSocket-Key",
+            tokio_tungstenite::tungstenite::handshake::client::generate_key(),
+        )
+        .body(())?;
+    Ok(request)
+}
+
 fn json_value_to_string(value: Option<&serde_json::Value>) -> Option<String> {
     match value? {
         serde_json::Value::String(text) => Some(text.clone()),
@@ -412,6 +443,12 @@ fn json_value_to_string(value: Option<&serde_json::Value>) -> Option<String> {
 }
 
 fn decode_cq_text(text: &str) -> String {
+    // CQ escapes all begin with '&'; the common unescaped case can skip the four
+    // replace passes and their intermediate allocations
+    if !text.contains('&') {
+        return text.to_string();
+    }
+
     text.replace("&#44;", ",")
         .replace("&#91;", "[")
         .replace("&#93;", "]")
@@ -511,12 +548,14 @@ fn parse_cq_string_to_messages(content: &str) -> Vec<Message> {
 }
 
 fn parse_forward_content_value(value: Option<&serde_json::Value>) -> Vec<Message> {
+    // Deserialize straight from the borrowed values; cloning the serde_json trees
+    // just to hand them to from_value copied every nested segment first
     match value {
         Some(serde_json::Value::Array(items)) => items
             .iter()
-            .filter_map(|item| serde_json::from_value::<Message>(item.clone()).ok())
+            .filter_map(|item| Message::deserialize(item).ok())
             .collect(),
-        Some(serde_json::Value::Object(_)) => serde_json::from_value::<Message>(value.cloned().unwrap())
+        Some(object @ serde_json::Value::Object(_)) => Message::deserialize(object)
             .map(|message| vec![message])
             .unwrap_or_default(),
         Some(serde_json::Value::String(text)) => parse_cq_string_to_messages(text),
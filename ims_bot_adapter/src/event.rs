@@ -1,4 +1,4 @@
-use log::{error, info};
+use log::{error, info, log_enabled, Level};
 use std::future::Future;
 use std::pin::Pin;
 use std::sync::Arc;
@@ -9,26 +9,28 @@ use crate::adapter::SharedBotAdapter;
 
 /// Process messages (both private and group)
 pub async fn process_message(ims_bot_adapter: SharedBotAdapter, event: MessageEvent) {
-    let messages: Vec<String> = event.message_list.iter().map(|m| m.to_string()).collect();
-
-    // Log based on message type
-    match event.message_type {
-        MessageType::Private => {
-            info!(
-                "[Friend Message] [message_id: {}] [Sender: {}({})] Message: {:?}",
-                event.message_id, event.sender.nickname, event.sender.user_id, messages
-            );
-        }
-        MessageType::Group => {
-            info!(
-                "[Group Message] [message_id: {}] [Group: {}({})] [Sender: {}({})] Message: {:?}",
-                event.message_id,
-                event.group_name.as_deref().unwrap_or_default(),
-                event.group_id.unwrap_or_default(),
-                event.sender.nickname,
-                event.sender.user_id,
-                messages
-            );
+    // Rendering every segment to a String per message is wasted work when info
+    // logging is disabled, so gate the whole block on the level check
+    if log_enabled!(Level::Info) {
+        let messages: Vec<String> = event.message_list.iter().map(|m| m.to_string()).collect();
+        match event.message_type {
+            MessageType::Private => {
+                info!(
+                    "[Friend Message] [message_id: {}] [Sender: {}({})] Message: {:?}",
+                    event.message_id, event.sender.nickname, event.sender.user_id, messages
+                );
+            }
+            MessageType::Group => {
+                info!(
+                    "[Group Message] [message_id: {}] [Group: {}({})] [Sender: {}({})] Message: {:?}",
+                    event.message_id,
+                    event.group_name.as_deref().unwrap_or_default(),
+                    event.group_id.unwrap_or_default(),
+                    event.sender.nickname,
+                    event.sender.user_id,
+                    messages
+                );
+            }
         }
     }
 
@@ -309,7 +309,7 @@ pub async fn query_redis(req: &mut Request, res: &mut Response, _depot: &mut Dep
                     Ok(c) => c,
                     Err(e) => return render_internal_error(res, format!("redis client open failed: {e}")),
                 };
-                match client.get_tokio_connection().await {
+                match redis::aio::ConnectionManager::new(client).await {
                     Ok(conn) => {
                         *cm = Some(conn);
                     }
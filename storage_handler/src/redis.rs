@@ -2,7 +2,7 @@ use std::panic::{catch_unwind, AssertUnwindSafe};
 use std::sync::Arc;
 
 use log::{debug, info, warn};
-use redis::aio::Connection;
+use redis::aio::{Connection, ConnectionManager};
 use redis::AsyncCommands;
 use reqwest::Url;
 use tokio::sync::Mutex as TokioMutex;
@@ -28,8 +28,7 @@ pub async fn build_redis_ref(url: &str) -> Result<Arc<RedisConfig>> {
 
 pub async fn set_value(redis_ref: &Arc<RedisConfig>, key: &str, value: &str) -> Result<()> {
     let first_error = {
-        let mut redis_cm = redis_ref.redis_cm.lock().await;
-        let conn = ensure_connection(redis_ref, &mut redis_cm).await?;
+        let mut conn = shared_connection(redis_ref).await?;
         match conn.set::<_, _, ()>(key, value).await {
             Ok(()) => return Ok(()),
             Err(err) => err,
@@ -38,8 +37,7 @@ pub async fn set_value(redis_ref: &Arc<RedisConfig>, key: &str, value: &str) ->
 
     invalidate_connection(redis_ref).await;
 
-    let mut redis_cm = redis_ref.redis_cm.lock().await;
-    let conn = ensure_connection(redis_ref, &mut redis_cm).await?;
+    let mut conn = shared_connection(redis_ref).await?;
     match conn.set::<_, _, ()>(key, value).await {
         Ok(()) => {
             debug!(
@@ -60,8 +58,7 @@ pub async fn set_value(redis_ref: &Arc<RedisConfig>, key: &str, value: &str) ->
 
 pub async fn get_value(redis_ref: &Arc<RedisConfig>, key: &str) -> Result<Option<String>> {
     let first_error = {
-        let mut redis_cm = redis_ref.redis_cm.lock().await;
-        let conn = ensure_connection(redis_ref, &mut redis_cm).await?;
+        let mut conn = shared_connection(redis_ref).await?;
         match conn.get(key).await {
             Ok(value) => return Ok(value),
             Err(err) => err,
@@ -70,8 +67,7 @@ pub async fn get_value(redis_ref: &Arc<RedisConfig>, key: &str) -> Result<Option
 
     invalidate_connection(redis_ref).await;
 
-    let mut redis_cm = redis_ref.redis_cm.lock().await;
-    let conn = ensure_connection(redis_ref, &mut redis_cm).await?;
+    let mut conn = shared_connection(redis_ref).await?;
     match conn.get(key).await {
         Ok(value) => {
             debug!(
@@ -92,8 +88,7 @@ pub async fn get_value(redis_ref: &Arc<RedisConfig>, key: &str) -> Result<Option
 
 pub async fn rpush_value(redis_ref: &Arc<RedisConfig>, key: &str, value: &str) -> Result<()> {
     let first_error = {
-        let mut redis_cm = redis_ref.redis_cm.lock().await;
-        let conn = ensure_connection(redis_ref, &mut redis_cm).await?;
+        let mut conn = shared_connection(redis_ref).await?;
         match conn.rpush::<_, _, ()>(key, value).await {
             Ok(()) => return Ok(()),
             Err(err) => err,
@@ -102,8 +97,7 @@ pub async fn rpush_value(redis_ref: &Arc<RedisConfig>, key: &str, value: &str) -
 
     invalidate_connection(redis_ref).await;
 
-    let mut redis_cm = redis_ref.redis_cm.lock().await;
-    let conn = ensure_connection(redis_ref, &mut redis_cm).await?;
+    let mut conn = shared_connection(redis_ref).await?;
     match conn.rpush::<_, _, ()>(key, value).await {
         Ok(()) => {
             debug!(
@@ -127,35 +121,15 @@ pub async fn blpop_value(
     key: &str,
     timeout_secs: usize,
 ) -> Result<Option<(String, String)>> {
-    let first_error = {
-        let mut redis_cm = redis_ref.redis_cm.lock().await;
-        let conn = ensure_connection(redis_ref, &mut redis_cm).await?;
-        match conn.blpop(key, timeout_secs as f64).await {
-            Ok(value) => return Ok(value),
-            Err(err) => err,
-        }
-    };
-
-    invalidate_connection(redis_ref).await;
-
-    let mut redis_cm = redis_ref.redis_cm.lock().await;
-    let conn = ensure_connection(redis_ref, &mut redis_cm).await?;
-    match conn.blpop(key, timeout_secs as f64).await {
-        Ok(value) => {
-            debug!(
-                "[storage_handler][redis] BLPOP recovered after reconnect for key '{}': {}",
-                key, first_error
-            );
-            Ok(value)
-        }
-        Err(err) => {
-            warn!(
-                "[storage_handler][redis] BLPOP failed after reconnect for key '{}': first_error={}, retry_error={}",
-                key, first_error, err
-            );
-            Err(Error::from(err))
-        }
-    }
+    // BLPOP must not run on the shared multiplexed connection: it would stall every
+    // command pipelined behind it. Open a dedicated connection per call; long-lived
+    // consumers should hold a RedisBlockingPopConnection instead.
+    let url = redis_ref
+        .url
+        .clone()
+        .ok_or_else(|| zihuan_core::string_error!("redis_ref missing url"))?;
+    let mut conn = connect_dedicated(&url).await?;
+    conn.blpop(key, timeout_secs as f64).await.map_err(Error::from)
 }
 
 pub struct RedisBlockingPopConnection {
@@ -205,7 +179,7 @@ impl RedisBlockingPopConnection {
                 .url
                 .clone()
                 .ok_or_else(|| zihuan_core::string_error!("redis_ref missing url"))?;
-            self.conn = Some(connect(&url).await?);
+            self.conn = Some(connect_dedicated(&url).await?);
         }
         self.conn
             .as_mut()
@@ -217,15 +191,22 @@ impl RedisBlockingPopConnection {
     }
 }
 
-async fn connect(url: &str) -> Result<Connection> {
+async fn connect(url: &str) -> Result<ConnectionManager> {
+    let client = redis::Client::open(url)?;
+    ConnectionManager::new(client).await.map_err(Error::from)
+}
+
+/// Dedicated single connection for blocking commands that must not share the
+/// multiplexed connection manager.
+async fn connect_dedicated(url: &str) -> Result<Connection> {
     let client = redis::Client::open(url)?;
     client.get_tokio_connection().await.map_err(Error::from)
 }
 
-async fn ensure_connection<'a>(
-    redis_ref: &Arc<RedisConfig>,
-    redis_cm: &'a mut Option<Connection>,
-) -> Result<&'a mut Connection> {
+/// Return a clone of the shared multiplexed connection, establishing it first if needed.
+/// Cloning lets callers run commands without holding the redis_cm mutex.
+async fn shared_connection(redis_ref: &Arc<RedisConfig>) -> Result<ConnectionManager> {
+    let mut redis_cm = redis_ref.redis_cm.lock().await;
     if redis_cm.is_none() {
         let url = redis_ref
             .url
@@ -236,7 +217,8 @@ async fn ensure_connection<'a>(
         *cached_redis_url = Some(url.to_string());
     }
     redis_cm
-        .as_mut()
+        .as_ref()
+        .cloned()
         .ok_or_else(|| zihuan_core::string_error!("redis connection unavailable"))
 }
 
@@ -248,7 +230,7 @@ async fn invalidate_connection(redis_ref: &Arc<RedisConfig>) {
 pub struct RedisNode {
     id: String,
     name: String,
-    redis_cm: Arc<TokioMutex<Option<Connection>>>,
+    redis_cm: Arc<TokioMutex<Option<ConnectionManager>>>,
     cached_redis_url: Arc<TokioMutex<Option<String>>>,
     run_initialized: bool,
     connection_id: Option<String>,
@@ -277,7 +259,7 @@ impl RedisNode {
     }
 
     fn run_cleanup_once(
-        redis_cm: Arc<TokioMutex<Option<Connection>>>,
+        redis_cm: Arc<TokioMutex<Option<ConnectionManager>>>,
         cached_redis_url: Arc<TokioMutex<Option<String>>>,
         url: String,
         force_reconnect: bool,
@@ -297,7 +279,7 @@ impl RedisNode {
 
             if cm_guard.is_none() {
                 let client = redis::Client::open(url.as_str())?;
-                let cm = client.get_tokio_connection().await?;
+                let cm = ConnectionManager::new(client).await?;
                 info!("[RedisNode] Connected to Redis at {}", url);
                 *cm_guard = Some(cm);
             }
@@ -314,7 +296,7 @@ impl RedisNode {
 
             if cm_guard.is_none() {
                 let client = redis::Client::open(url.as_str())?;
-                let cm = client.get_tokio_connection().await?;
+                let cm = ConnectionManager::new(client).await?;
                 *cm_guard = Some(cm);
             }
 
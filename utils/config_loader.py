@@ -1,10 +1,23 @@
+import functools
 import os
 import yaml
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel, Field
 from utils.logging_config import logger
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # C extension, ~10x faster parse
+except ImportError:  # pragma: no cover - depends on how PyYAML was built
+    from yaml import SafeLoader as _YamlLoader
+
+
+@functools.lru_cache(maxsize=None)
+def load_yaml_config(config_path: str) -> dict[str, Any]:
+    """Parse a YAML config file once per path; repeated loaders share the result."""
+    with open(config_path, "rb") as file:
+        return yaml.load(file, Loader=_YamlLoader) or {}
+
 
 class Config(BaseModel):
     """Configuration model with explicit fields for IDE autocompletion."""
@@ -46,14 +59,19 @@ class ConfigLoader:
             self.config = Config()
             return
         
-        with open(config_path) as file:
-            logger.info(f"Loading config from {config_path}")
-            yaml_data = yaml.safe_load(file) or {}
-            self.config = Config(**yaml_data)
+        logger.info(f"Loading config from {config_path}")
+        self.config = Config(**load_yaml_config(config_path))
     
     def __getattr__(self, name: str):
-        """Allow accessing config attributes directly from loader."""
-        return getattr(self.config, name)
+        """Allow accessing config attributes directly from loader.
+
+        The resolved value is cached on the loader instance so repeated lookups
+        are plain attribute hits instead of going through __getattr__ again.
+        """
+        value = getattr(self.config, name)
+        if not name.startswith("_"):
+            self.__dict__[name] = value
+        return value
 
 
 config = ConfigLoader("config.yaml")
\ No newline at end of file
@@ -1,29 +1,45 @@
+import functools
+
+
+@functools.lru_cache(maxsize=1)
+def _read_project_config() -> dict:
+    """Read config.yaml from the project root once; both discovery helpers share it."""
+    try:
+        import yaml
+
+        try:
+            from yaml import CSafeLoader as _YamlLoader
+        except ImportError:
+            from yaml import SafeLoader as _YamlLoader
+
+        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+        cfg_path = os.path.join(project_root, "config.yaml")
+        if os.path.exists(cfg_path):
+            with open(cfg_path, "rb") as f:
+                loaded = yaml.load(f, Loader=_YamlLoader)
+                if isinstance(loaded, dict):
+                    return loaded
+    except Exception:
+        # Swallow and fallback
+        pass
+    return {}
+
+
 # --- LOG LEVEL DISCOVERY ---
 def _discover_log_level() -> int:
     """Resolve log level with the following priority:
-    1) Environment variable: LOG_LEVEL
+    1) Environment variables: ZIHUAN_LOG_LEVEL, then LOG_LEVEL
     2) config.yaml key: log_level
-    3) Default: logging.DEBUG
+    3) Default: logging.INFO
     Returns the logging level constant (e.g., logging.INFO).
     """
-    level_str = os.getenv("LOG_LEVEL")
+    level_str = os.getenv("ZIHUAN_LOG_LEVEL") or os.getenv("LOG_LEVEL")
     if not level_str:
-        # Try config.yaml
-        try:
-            import yaml
-            project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-            cfg_path = os.path.join(project_root, "config.yaml")
-            if os.path.exists(cfg_path):
-                with open(cfg_path, "r", encoding="utf-8") as f:
-                    loaded = yaml.safe_load(f)
-                    if isinstance(loaded, dict):
-                        raw = loaded.get("log_level")
-                        if isinstance(raw, str) and raw.strip():
-                            level_str = raw.strip()
-        except Exception:
-            pass
+        raw = _read_project_config().get("log_level")
+        if isinstance(raw, str) and raw.strip():
+            level_str = raw.strip()
     if not level_str:
-        return logging.DEBUG
+        return logging.INFO
     # Map string to logging level
     level_str = level_str.strip().upper()
     level_map = {
@@ -34,10 +50,12 @@ def _discover_log_level() -> int:
         "DEBUG": logging.DEBUG,
         "NOTSET": logging.NOTSET,
     }
-    return level_map.get(level_str, logging.DEBUG)
+    return level_map.get(level_str, logging.INFO)
+import atexit
 import logging
 import os
-from logging.handlers import TimedRotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from typing import Optional
 
 
@@ -58,24 +76,10 @@ def _discover_log_dir() -> str:
         return env_dir
 
     # 2) Try read config.yaml next to project root
-    try:
-        from typing import Any
-        from typing import Optional as _Optional
-
-        import yaml  # local import to avoid hard dependency at import time if unused
-
-        project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-        cfg_path = os.path.join(project_root, "config.yaml")
-        if os.path.exists(cfg_path):
-            with open(cfg_path, "r", encoding="utf-8") as f:
-                loaded: Any = yaml.safe_load(f)
-                if isinstance(loaded, dict):
-                    raw: _Optional[str] = loaded.get("loger_path") or loaded.get("logger_path")  # type: ignore[reportUnknownMemberType]
-                    if isinstance(raw, str) and raw.strip():
-                        return raw
-    except Exception:
-        # Swallow and fallback
-        pass
+    loaded = _read_project_config()
+    raw = loaded.get("loger_path") or loaded.get("logger_path")
+    if isinstance(raw, str) and raw.strip():
+        return raw
 
     # 3) Default
     return os.path.join(
@@ -83,6 +87,11 @@ def _discover_log_dir() -> str:
     )
 
 
+# The formatter does not use process/thread fields; skip their per-record lookups
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
 logger = logging.getLogger("zihuan")
 log_level = _discover_log_level()
 logger.setLevel(log_level)
@@ -117,14 +126,24 @@ except Exception:
 console_handler = logging.StreamHandler()
 console_handler.setLevel(log_level)
 
-formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+formatter = logging.Formatter(
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    datefmt="%Y-%m-%d %H:%M:%S",
+)
 
-# Avoid attaching duplicate handlers if re-imported
-existing_types = {type(h) for h in logger.handlers}
-if file_handler and TimedRotatingFileHandler not in existing_types:
+console_handler.setFormatter(formatter)
+if file_handler:
     file_handler.setFormatter(formatter)
-    logger.addHandler(file_handler)
 
-if logging.StreamHandler not in existing_types:
-    console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+# Logger calls must not do synchronous file/stream writes on hot paths (e.g. the
+# event loop): attach only a QueueHandler so each call is an O(1) enqueue, and let
+# a background listener thread do the formatting, rotation, and writes.
+# Avoid attaching duplicate handlers if re-imported.
+existing_types = {type(h) for h in logger.handlers}
+if QueueHandler not in existing_types:
+    _log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    _target_handlers = [handler for handler in (file_handler, console_handler) if handler is not None]
+    _queue_listener = QueueListener(_log_queue, *_target_handlers, respect_handler_level=True)
+    _queue_listener.start()
+    atexit.register(_queue_listener.stop)
+    logger.addHandler(QueueHandler(_log_queue))
@@ -2,7 +2,7 @@ use serde::{Deserialize, Serialize};
 use std::fmt;
 
 use log::warn;
-use serde::de::Deserializer;
+use serde::de::{Deserializer, SeqAccess, Visitor};
 
 use crate::ims_bot_adapter::models::message::Message;
 
@@ -70,20 +70,55 @@ pub struct RawMessageEvent {
     pub group_name: Option<String>,
 }
 
+impl From<RawMessageEvent> for MessageEvent {
+    /// Build the processed event by moving the deserialized fields; no per-field
+    /// copies or revalidation on the hot path.
+    fn from(raw: RawMessageEvent) -> Self {
+        let is_group_message = matches!(raw.message_type, MessageType::Group);
+        Self {
+            message_id: raw.message_id,
+            message_type: raw.message_type,
+            sender: raw.sender,
+            message_list: raw.message,
+            group_id: raw.group_id,
+            group_name: raw.group_name,
+            is_group_message,
+        }
+    }
+}
+
 fn deserialize_message_vec_lenient<'de, D>(deserializer: D) -> Result<Vec<Message>, D::Error>
 where
     D: Deserializer<'de>,
 {
-    let raw_values = Vec::<serde_json::Value>::deserialize(deserializer)?;
+    struct LenientMessageVecVisitor;
 
-    let mut out = Vec::with_capacity(raw_values.len());
-    for v in raw_values {
-        match serde_json::from_value::<Message>(v) {
-            Ok(m) => out.push(m),
-            Err(e) => {
-                warn!("Skipping unsupported message element: {}", e);
+    impl<'de> Visitor<'de> for LenientMessageVecVisitor {
+        type Value = Vec<Message>;
+
+        fn expecting(&self, formatter: &mut fmt::Formatter) -> fmt::Result {
+            formatter.write_str("a sequence of message elements")
+        }
+
+        fn visit_seq<A>(self, mut seq: A) -> Result<Vec<Message>, A::Error>
+        where
+            A: SeqAccess<'de>,
+        {
+            // Convert each element as it is pulled from the sequence; the previous
+            // implementation buffered the whole list as serde_json::Value first and
+            // made a second pass over it for every inbound frame
+            let mut out = Vec::with_capacity(seq.size_hint().unwrap_or(0));
+            while let Some(v) = seq.next_element::<serde_json::Value>()? {
+                match serde_json::from_value::<Message>(v) {
+                    Ok(m) => out.push(m),
+                    Err(e) => {
+                        warn!("Skipping unsupported message element: {}", e);
+                    }
+                }
             }
+            Ok(out)
         }
     }
-    Ok(out)
+
+    deserializer.deserialize_seq(LenientMessageVecVisitor)
 }
@@ -1,5 +1,5 @@
 use crate::object_storage::S3Ref;
-use redis::{aio::Connection, AsyncCommands};
+use redis::{aio::ConnectionManager, AsyncCommands};
 use serde::{Deserialize, Serialize};
 use serde_json::Value;
 use std::collections::HashMap;
@@ -35,7 +35,7 @@ pub struct RedisConfig {
     pub reconnect_max_attempts: Option<u32>,
     pub reconnect_interval_secs: Option<u64>,
     /// Shared Redis connection pool maintained by the RedisNode.
-    pub redis_cm: Arc<TokioMutex<Option<Connection>>>,
+    pub redis_cm: Arc<TokioMutex<Option<ConnectionManager>>>,
     /// Tracks the URL used to build the current pool.
     pub cached_redis_url: Arc<TokioMutex<Option<String>>>,
 }
@@ -68,7 +68,7 @@ impl fmt::Debug for RedisConfig {
             .field("password", &self.password.as_ref().map(|_| "<redacted>"))
             .field("reconnect_max_attempts", &self.reconnect_max_attempts)
             .field("reconnect_interval_secs", &self.reconnect_interval_secs)
-            .field("redis_cm", &"<TokioMutex<Option<Connection>>>")
+            .field("redis_cm", &"<TokioMutex<Option<ConnectionManager>>>")
             .field("cached_redis_url", &"<TokioMutex<Option<String>>>")
             .finish()
     }
@@ -215,7 +215,7 @@ impl fmt::Debug for SessionStateRef {
 pub struct LLMMessageSessionCacheRef {
     pub node_id: String,
     pub memory_cache: Arc<TokioMutex<HashMap<String, Vec<zihuan_core::llm::LLMMessage>>>>,
-    pub redis_cm: Arc<TokioMutex<Option<Connection>>>,
+    pub redis_cm: Arc<TokioMutex<Option<ConnectionManager>>>,
     pub cached_redis_url: Arc<TokioMutex<Option<String>>>,
     pub sender_bucket_map: Arc<TokioMutex<HashMap<String, String>>>,
     pub default_bucket_name: Arc<TokioMutex<String>>,
@@ -347,7 +347,7 @@ impl LLMMessageSessionCacheRef {
 
             if cm_guard.is_none() {
                 let client = redis::Client::open(url.as_str())?;
-                match client.get_tokio_connection().await {
+                match ConnectionManager::new(client).await {
                     Ok(cm) => {
                         *cm_guard = Some(cm);
                     }
@@ -393,7 +393,7 @@ impl LLMMessageSessionCacheRef {
 
             if cm_guard.is_none() {
                 let client = redis::Client::open(url.as_str())?;
-                match client.get_tokio_connection().await {
+                match ConnectionManager::new(client).await {
                     Ok(cm) => {
                         *cm_guard = Some(cm);
                     }
@@ -446,7 +446,7 @@ impl LLMMessageSessionCacheRef {
 
             if cm_guard.is_none() {
                 let client = redis::Client::open(url.as_str())?;
-                match client.get_tokio_connection().await {
+                match ConnectionManager::new(client).await {
                     Ok(cm) => {
                         *cm_guard = Some(cm);
                     }
@@ -501,7 +501,7 @@ impl LLMMessageSessionCacheRef {
 
             if cm_guard.is_none() {
                 let client = redis::Client::open(url.as_str())?;
-                match client.get_tokio_connection().await {
+                match ConnectionManager::new(client).await {
                     Ok(cm) => {
                         *cm_guard = Some(cm);
                     }
@@ -540,7 +540,7 @@ impl fmt::Debug for LLMMessageSessionCacheRef {
         f.debug_struct("LLMMessageSessionCacheRef")
             .field("node_id", &self.node_id)
             .field("memory_cache", &"<TokioMutex<HashMap<...>>>")
-            .field("redis_cm", &"<TokioMutex<Option<Connection>>>")
+            .field("redis_cm", &"<TokioMutex<Option<ConnectionManager>>>")
             .field("cached_redis_url", &"<TokioMutex<Option<String>>>")
             .field("sender_bucket_map", &"<TokioMutex<HashMap<...>>>")
             .field("default_bucket_name", &"<TokioMutex<String>>")
@@ -2,7 +2,7 @@ use crate::data_value::RedisConfig;
 use crate::message_persistence::register_redis_persistence_ref;
 use crate::{node_input, node_output, DataType, DataValue, Node, Port};
 use log::{info, warn};
-use redis::aio::Connection;
+use redis::aio::ConnectionManager;
 use redis::AsyncCommands;
 use std::panic::{catch_unwind, AssertUnwindSafe};
 use std::sync::Arc;
@@ -15,7 +15,7 @@ use zihuan_core::url_utils::pct_encode;
 pub struct RedisNode {
     id: String,
     name: String,
-    redis_cm: Arc<TokioMutex<Option<Connection>>>,
+    redis_cm: Arc<TokioMutex<Option<ConnectionManager>>>,
     cached_redis_url: Arc<TokioMutex<Option<String>>>,
     run_initialized: bool,
 }
@@ -36,7 +36,7 @@ impl RedisNode {
     }
 
     fn run_cleanup_once(
-        redis_cm: Arc<TokioMutex<Option<Connection>>>,
+        redis_cm: Arc<TokioMutex<Option<ConnectionManager>>>,
         cached_redis_url: Arc<TokioMutex<Option<String>>>,
         url: String,
         force_reconnect: bool,
@@ -56,7 +56,7 @@ impl RedisNode {
 
             if cm_guard.is_none() {
                 let client = redis::Client::open(url.as_str())?;
-                let cm = client.get_tokio_connection().await?;
+                let cm = ConnectionManager::new(client).await?;
                 info!("[RedisNode] Connected to Redis at {}", url);
                 *cm_guard = Some(cm);
             }
@@ -73,7 +73,7 @@ impl RedisNode {
 
             if cm_guard.is_none() {
                 let client = redis::Client::open(url.as_str())?;
-                let cm = client.get_tokio_connection().await?;
+                let cm = ConnectionManager::new(client).await?;
                 info!("[RedisNode] Reconnected to Redis at {}", url);
                 *cm_guard = Some(cm);
             }
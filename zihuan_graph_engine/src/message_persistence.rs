@@ -15,7 +15,7 @@ use tokio::task::block_in_place;
 use zihuan_core::data_refs::{MySqlConfig, RelationalDbConnection, SqliteConfig};
 use zihuan_core::error::Result;
 use zihuan_core::ims_bot_adapter::models::event_model::MessageEvent;
-use zihuan_core::ims_bot_adapter::models::message::{collect_media_records, Message};
+use zihuan_core::ims_bot_adapter::models::message::{collect_media_records, Message, MessageMediaRecord};
 
 static LATEST_RDB_POOL: Lazy<RwLock<Option<RelationalDbConnection>>> = Lazy::new(|| RwLock::new(None));
 static LATEST_REDIS_REF: Lazy<RwLock<Option<Arc<RedisConfig>>>> = Lazy::new(|| RwLock::new(None));
@@ -61,6 +61,7 @@ fn persist_message_to_redis(
 
     let redis_ref = Arc::clone(redis_ref);
     let message_id = message_id.to_string();
+    let message_id_for_log = message_id.clone();
     let payload = serde_json::to_string(payload)?;
 
     let run = async move {
@@ -74,7 +75,7 @@ fn persist_message_to_redis(
 
         if cm_guard.is_none() {
             let client = redis::Client::open(url.as_str())?;
-            *cm_guard = Some(client.get_tokio_connection().await?);
+            *cm_guard = Some(redis::aio::ConnectionManager::new(client).await?);
         }
 
         if let Some(cm) = cm_guard.as_mut() {
@@ -84,14 +85,31 @@ fn persist_message_to_redis(
         Ok::<(), zihuan_core::error::Error>(())
     };
 
+    // The cache write result is only ever logged, so inside a runtime the SET is
+    // spawned as its own task instead of blocking the worker thread on the round trip.
     if let Ok(handle) = tokio::runtime::Handle::try_current() {
-        block_in_place(|| handle.block_on(run))
+        handle.spawn(async move {
+            if let Err(error) = run.await {
+                warn!(
+                    "[message_persistence] Redis cache write failed for message {}: {}",
+                    message_id_for_log, error
+                );
+            }
+        });
+        Ok(())
     } else {
         tokio::runtime::Runtime::new()?.block_on(run)
     }
 }
 
-fn persist_message_to_rdb(event: &MessageEvent, connection: &RelationalDbConnection) -> Result<()> {
+fn persist_message_to_rdb(
+    event: &MessageEvent,
+    connection: &RelationalDbConnection,
+    content: &str,
+    media_json: Option<&String>,
+    raw_message_json: Option<&String>,
+    media_records: &[MessageMediaRecord],
+) -> Result<()> {
     let raw_message_id = event.message_id.to_string();
     let message_id =
         truncate_field_if_needed("message_id", raw_message_id.clone(), MESSAGE_ID_MAX_CHARS, &raw_message_id);
@@ -112,7 +130,6 @@ fn persist_message_to_rdb(event: &MessageEvent, connection: &RelationalDbConnect
     );
     let group_name =
         truncate_optional_field_if_needed("group_name", event.group_name.clone(), GROUP_NAME_MAX_CHARS, &message_id);
-    let content = render_content(&event.message_list);
     let at_targets: Vec<String> = event
         .message_list
         .iter()
@@ -127,17 +144,10 @@ fn persist_message_to_rdb(event: &MessageEvent, connection: &RelationalDbConnect
         AT_TARGET_LIST_MAX_CHARS,
         &message_id,
     );
-    let media_json = {
-        let records = collect_media_records(&event.message_list);
-        if records.is_empty() {
-            None
-        } else {
-            Some(serde_json::to_string(&records)?)
-        }
-    };
-    let media_json = truncate_optional_field_if_needed("media_json", media_json, MEDIA_JSON_MAX_CHARS, &message_id);
-    let raw_message_json = Some(serde_json::to_string(&event.message_list)?);
-    let content_chunks = split_content_chunks(&content, CONTENT_MAX_CHARS);
+    let media_json =
+        truncate_optional_field_if_needed("media_json", media_json.cloned(), MEDIA_JSON_MAX_CHARS, &message_id);
+    let raw_message_json = raw_message_json.cloned();
+    let content_chunks = split_content_chunks(content, CONTENT_MAX_CHARS);
 
     info!(
         "[message_persistence] Persisting message {} (sender={}, group={:?}, chunks={}) to relational DB",
@@ -267,12 +277,11 @@ fn persist_message_to_rdb(event: &MessageEvent, connection: &RelationalDbConnect
         );
     }
 
-    let media_records = collect_media_records(&event.message_list);
     if !media_records.is_empty() {
         let persist_result = match connection {
             RelationalDbConnection::MySql(config) => {
                 let pool = mysql_pool(config)?.clone();
-                let records = media_records.clone();
+                let records = media_records.to_vec();
                 let run = async move {
                     for record in &records {
                         sqlx::query(
@@ -308,7 +317,7 @@ fn persist_message_to_rdb(event: &MessageEvent, connection: &RelationalDbConnect
             }
             RelationalDbConnection::Sqlite(config) => {
                 let pool = sqlite_pool(config)?.clone();
-                let records = media_records.clone();
+                let records = media_records.to_vec();
                 let run = async move {
                     for record in &records {
                         sqlx::query(
@@ -355,26 +364,35 @@ pub fn persist_message_event(
 ) -> Result<()> {
     cache_message_snapshot(event);
 
+    // Render and serialize once; the Redis snapshot and the relational rows reuse
+    // the same strings instead of re-serializing the message list per sink
     let message_id = event.message_id.to_string();
     let content = render_content(&event.message_list);
-    let media_json = {
-        let records = collect_media_records(&event.message_list);
-        if records.is_empty() {
-            None
-        } else {
-            Some(serde_json::to_string(&records)?)
-        }
+    let media_records = collect_media_records(&event.message_list);
+    let media_json = if media_records.is_empty() {
+        None
+    } else {
+        Some(serde_json::to_string(&media_records)?)
     };
     let raw_message_json = Some(serde_json::to_string(&event.message_list)?);
     let redis_payload = CachedMessageSnapshotPayload {
         message_id: message_id.clone(),
         content: content.clone(),
-        media_json,
-        raw_message_json,
+        media_json: media_json.clone(),
+        raw_message_json: raw_message_json.clone(),
     };
 
-    if let Some(redis_ref) = redis_ref.cloned().or_else(latest_redis_ref) {
-        register_redis_ref(redis_ref.clone());
+    // Only an explicitly supplied ref needs to be pushed into the restore-side
+    // registry; the cached fallback already lives there, and re-registering it
+    // took a registry write lock on every persisted message
+    let resolved_redis_ref = match redis_ref {
+        Some(redis_ref) => {
+            register_redis_ref(redis_ref.clone());
+            Some(redis_ref.clone())
+        }
+        None => latest_redis_ref(),
+    };
+    if let Some(redis_ref) = resolved_redis_ref {
         if let Err(error) = persist_message_to_redis(&message_id, &redis_payload, &redis_ref) {
             warn!(
                 "[message_persistence] Redis cache write failed for message {}: {}",
@@ -383,9 +401,22 @@ pub fn persist_message_event(
         }
     }
 
-    if let Some(rdb_pool) = rdb_pool.cloned().or_else(latest_rdb_pool) {
-        register_rdb_pool(rdb_pool.clone());
-        persist_message_to_rdb(event, &rdb_pool)?;
+    let resolved_rdb_pool = match rdb_pool {
+        Some(rdb_pool) => {
+            register_rdb_pool(rdb_pool.clone());
+            Some(rdb_pool.clone())
+        }
+        None => latest_rdb_pool(),
+    };
+    if let Some(rdb_pool) = resolved_rdb_pool {
+        persist_message_to_rdb(
+            event,
+            &rdb_pool,
+            &content,
+            media_json.as_ref(),
+            raw_message_json.as_ref(),
+            &media_records,
+        )?;
     }
 
     Ok(())
@@ -3,7 +3,7 @@ use log::{debug, warn};
 use once_cell::sync::Lazy;
 use redis::AsyncCommands;
 use sqlx::Row;
-use std::collections::HashMap;
+use std::collections::{HashMap, VecDeque};
 use std::sync::{Arc, RwLock};
 use tokio::task::block_in_place;
 use zihuan_core::data_refs::{MySqlConfig, RelationalDbConnection, SqliteConfig};
@@ -13,7 +13,42 @@ use zihuan_core::ims_bot_adapter::models::message::{
     ImageMessage, Message, MessageMediaRecord, PersistedMedia, PersistedMediaSource, PlainTextMessage,
 };
 
-static RUNTIME_MESSAGE_INDEX: Lazy<RwLock<HashMap<String, Vec<Message>>>> = Lazy::new(|| RwLock::new(HashMap::new()));
+const RUNTIME_MESSAGE_INDEX_MAX_ENTRIES: usize = 10_000;
+
+/// In-memory snapshot index evicting its oldest entries once full, so a
+/// long-running bot without Redis/MySQL configured cannot grow it without bound.
+struct BoundedMessageIndex {
+    entries: HashMap<String, Vec<Message>>,
+    insertion_order: VecDeque<String>,
+}
+
+impl BoundedMessageIndex {
+    fn new() -> Self {
+        Self {
+            entries: HashMap::new(),
+            insertion_order: VecDeque::new(),
+        }
+    }
+
+    fn get(&self, message_id: &str) -> Option<&Vec<Message>> {
+        self.entries.get(message_id)
+    }
+
+    fn insert(&mut self, message_id: String, messages: Vec<Message>) {
+        if self.entries.insert(message_id.clone(), messages).is_none() {
+            self.insertion_order.push_back(message_id);
+        }
+        while self.entries.len() > RUNTIME_MESSAGE_INDEX_MAX_ENTRIES {
+            let Some(oldest) = self.insertion_order.pop_front() else {
+                break;
+            };
+            self.entries.remove(&oldest);
+        }
+    }
+}
+
+static RUNTIME_MESSAGE_INDEX: Lazy<RwLock<BoundedMessageIndex>> =
+    Lazy::new(|| RwLock::new(BoundedMessageIndex::new()));
 static LATEST_RDB_POOL: Lazy<RwLock<Option<RelationalDbConnection>>> = Lazy::new(|| RwLock::new(None));
 static LATEST_REDIS_REF: Lazy<RwLock<Option<Arc<RedisConfig>>>> = Lazy::new(|| RwLock::new(None));
 
@@ -373,7 +408,7 @@ fn restore_message_snapshot_from_redis(
 
         if cm_guard.is_none() {
             let client = redis::Client::open(url.as_str())?;
-            *cm_guard = Some(client.get_tokio_connection().await?);
+            *cm_guard = Some(redis::aio::ConnectionManager::new(client).await?);
         }
 
         let Some(cm) = cm_guard.as_mut() else {